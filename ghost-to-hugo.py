@@ -8,12 +8,12 @@ License: MIT
 
 ✨ Features
 ------------
-- Converts HTML → Markdown using html2text
-- Generates Hugo-compatible YAML front matter
+- Converts HTML → Markdown using html-to-markdown (html2text as fallback)
+- Generates Hugo-compatible JSON, YAML or TOML front matter
 - Preserves SEO, author, cover, and image metadata
 - Copies referenced images into each post's folder
 - Rewrites all image URLs (content + front matter) to relative paths (./image.jpg)
-- Validates and moves invalid outputs automatically
+- Validates front matter and writes invalid outputs to a separate folder
 - Adds sensible Hugo defaults (description, cover, type, reading_time)
 - Auto-selects OpenGraph image (og_image > feature_image > first content image)
 - Cleans up emojis, umlauts, and all UTF-8 hex artifacts from slugs
@@ -31,186 +31,380 @@ import re
 import json
 import html2text
 import shutil
+import sys
+import stat
 import yaml
 import argparse
+import functools
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from datetime import datetime
+from importlib import metadata
 from urllib.parse import urlparse
 
+try:
+    import orjson
+except ImportError:  # optional faster JSON parser; stdlib json is the fallback
+    orjson = None
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper
+
+try:
+    import ijson
+except ImportError:  # only needed for --stream
+    ijson = None
+
+try:
+    import tomli_w
+except ImportError:  # only needed for --front-matter toml
+    tomli_w = None
+
+try:
+    # pre-3.x convert() returns a str, not a ConversionResult
+    if int(metadata.version("html-to-markdown").split(".")[0]) < 3:
+        raise ImportError("html-to-markdown >= 3 required")
+    from html_to_markdown import ConversionOptions, convert as rust_convert
+except ImportError:  # optional Rust-backed converter; html2text is the fallback
+    rust_convert = None
+
+
+# === Precompiled patterns ===
+
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F1E0-\U0001F1FF"  # flags
+    "\U00002700-\U000027BF"  # dingbats
+    "\U0001F900-\U0001F9FF"  # supplemental symbols and pictographs
+    "\U00002600-\U000026FF"  # miscellaneous symbols
+    "\U0001FA70-\U0001FAFF"  # extended pictographs
+    "]+",
+    flags=re.UNICODE,
+)
+_SURROGATE_RE = re.compile(r"[\uD800-\uDBFF][\uDC00-\uDFFF]")
+_DASH_RE = re.compile(r"[-–—‒−]")
+_HEX_CHAINS_RE = re.compile(r'^(?:(?:[0-9a-f]{2}-){2,}[0-9a-f]{2}(?:-)?)+')
+_SLUG_SEP_RE = re.compile(r"[^a-z0-9]+")
+_IMG_URL_RE = re.compile(
+    r'(?:https?:\/\/[^)\/]+)?(?:\/content\/images\/[^\)]*\/)?([^\/\)]+\.(?:jpg|jpeg|png|gif|webp|avif))',
+    flags=re.IGNORECASE,
+)
+# Markdown images, with the optional "title" html-to-markdown emits for <img title="...">
+_IMG_MD_RE = re.compile(r'!\[.*?\]\(([^)\s]+)(?:\s+"[^"]*")?\)')
+_IMG_ALT_URL_RE = re.compile(r'!\[(.*?)\]\(([^)\s]+)(\s+"[^"]*")?\)')
+_WORD_RE = re.compile(r"\w+")
+
+
+# === Translation tables ===
+
+class _SlugTable(dict):
+    """str.translate() table: umlauts → ASCII, emojis and pictographs → dropped.
+
+    Codepoints outside the BMP (where all emoji blocks live) are dropped lazily
+    on first sight and memoized, so the table only grows with the characters
+    actually seen instead of holding a million entries up front.
+    """
+
+    def __missing__(self, cp: int):
+        value = None if cp >= 0x10000 else cp
+        self[cp] = value
+        return value
+
+
+_SLUG_TABLE = _SlugTable(str.maketrans({
+    "ä": "ae", "ö": "oe", "ü": "ue",
+    "Ä": "Ae", "Ö": "Oe", "Ü": "Ue",
+    "ß": "ss",
+}))
+_SLUG_TABLE.update(dict.fromkeys(range(0x2600, 0x27C0)))  # misc symbols & dingbats
+_SLUG_TABLE.update(dict.fromkeys(range(0xD800, 0xE000)))  # stray surrogates (UCS-2)
 
-# === Utility helpers ===
-
-def normalize_umlauts(text: str) -> str:
-    """Replace German umlauts and ß with ASCII equivalents."""
-    replacements = {
-        "ä": "ae", "ö": "oe", "ü": "ue",
-        "Ä": "Ae", "Ö": "Oe", "Ü": "Ue",
-        "ß": "ss",
-    }
-    for k, v in replacements.items():
-        text = text.replace(k, v)
-    return text
 
+# === Utility helpers ===
 
 def remove_emojis(s: str) -> str:
     """Remove all emojis and pictographic symbols, UCS-2 and UCS-4 safe."""
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # symbols & pictographs
-        "\U0001F680-\U0001F6FF"  # transport & map symbols
-        "\U0001F1E0-\U0001F1FF"  # flags
-        "\U00002700-\U000027BF"  # dingbats
-        "\U0001F900-\U0001F9FF"  # supplemental symbols and pictographs
-        "\U00002600-\U000026FF"  # miscellaneous symbols
-        "\U0001FA70-\U0001FAFF"  # extended pictographs
-        "]+",
-        flags=re.UNICODE,
-    )
-    # Also remove surrogate pairs (UCS-2 safe)
-    s = re.sub(r"[\uD800-\uDBFF][\uDC00-\uDFFF]", "", s)
-    return emoji_pattern.sub("", s)
+    if s.isascii():
+        return s
+    # Remove stray surrogate pairs first (UCS-2 safe)
+    s = _SURROGATE_RE.sub("", s)
+    return _EMOJI_RE.sub("", s)
 
 
 def normalize_dashes(s: str) -> str:
     """Normalize unicode dashes to ASCII hyphen-minus."""
-    return re.sub(r"[-–—‒−]", "-", s)
+    return _DASH_RE.sub("-", s)
 
 
 def strip_leading_hex_chains(s: str) -> str:
     """Remove Ghost’s UTF-8 hex-byte slugs like f0-9f-93-9a-..."""
     t = s.strip().lower()
-    while True:
-        m = re.match(r'^(?:[0-9a-f]{2}-){2,}[0-9a-f]{2}(?:-)?', t)
-        if not m:
-            break
+    m = _HEX_CHAINS_RE.match(t)
+    if m:
         t = t[m.end():]
     return t.lstrip("-_").strip()
 
 
+@functools.lru_cache(maxsize=4096)
 def clean_slug(slug_or_title: str) -> str:
     """Remove emojis and special symbols, normalize umlauts, and create a safe Hugo slug."""
-    cleaned = remove_emojis(slug_or_title)
-    cleaned = normalize_umlauts(cleaned)
-    cleaned = re.sub(r"[^a-zA-Z0-9\-]+", "-", cleaned.lower())
-    cleaned = re.sub(r"-+", "-", cleaned).strip("-")
-    return cleaned
+    if slug_or_title.isascii():
+        cleaned = slug_or_title.lower()
+    else:
+        cleaned = slug_or_title.translate(_SLUG_TABLE).lower()
+    return _SLUG_SEP_RE.sub("-", cleaned).strip("-")
 
 
-def safe_slug_from(post: dict) -> str:
-    """Return a cleaned slug, prioritizing the TITLE over Ghost’s slug."""
-    title = (post.get("title") or "").strip()
-    ghost_slug = (post.get("slug") or "").strip()
-    raw = normalize_dashes(title)
-    raw = remove_emojis(raw)
-    slug_from_title = clean_slug(raw)
+@functools.lru_cache(maxsize=4096)
+def _slug_from_title_and_ghost(title: str, ghost_slug: str) -> str:
+    """Pure slug transform behind safe_slug_from(); empty if neither input yields one."""
+    slug_from_title = clean_slug(normalize_dashes(title))
     if slug_from_title:
         return slug_from_title
     ghost_raw = normalize_dashes(ghost_slug)
     ghost_raw = strip_leading_hex_chains(ghost_raw)
-    ghost_raw = remove_emojis(ghost_raw)
-    slug = clean_slug(ghost_raw)
+    return clean_slug(ghost_raw)
+
+
+def safe_slug_from(post: dict) -> str:
+    """Return a cleaned slug, prioritizing the TITLE over Ghost’s slug."""
+    title = (post.get("title") or "").strip()
+    ghost_slug = (post.get("slug") or "").strip()
+    slug = _slug_from_title_and_ghost(title, ghost_slug)
     return slug or f"untitled-{post.get('id', 'noid')}"
 
 
-def rewrite_image_paths(markdown: str) -> str:
-    """Rewrite all Ghost image URLs to local relative paths (./filename)."""
-    return re.sub(
-        r'!\[(.*?)\]\((?:https?:\/\/[^)\/]+)?(?:\/content\/images\/[^\)]*\/)?([^\/\)]+\.(?:jpg|jpeg|png|gif|webp|avif))\)',
-        r'![\1](./\2)',
-        markdown,
-        flags=re.IGNORECASE
-    )
+def localize_images(markdown: str, default_alt: str) -> str:
+    """Fill empty image alts and rewrite Ghost image URLs to ./filename in one pass."""
+    def _fix(m):
+        alt, url, title = m.group(1), m.group(2), m.group(3) or ""
+        if not alt.strip():
+            alt = default_alt
+        local = _IMG_URL_RE.fullmatch(url)
+        if local:
+            url = f"./{local.group(1)}"
+        return f"![{alt}]({url}{title})"
+
+    return _IMG_ALT_URL_RE.sub(_fix, markdown)
 
 
-def ensure_image_alts(markdown: str, default_alt: str) -> str:
-    """Fill empty Markdown image alts: ![](path) → ![default_alt](path)."""
-    return re.sub(r'!\[\s*\]\(([^)]+)\)', fr'![{re.escape(default_alt)}](\1)', markdown)
+def to_hugo_date(value: str) -> str:
+    """Format a Ghost timestamp as Hugo's %Y-%m-%dT%H:%M:%S%z.
 
+    Ghost writes UTC timestamps as 2020-06-13T13:52:53.000Z, which only needs
+    slicing; anything else goes through datetime.
+    """
+    if value.endswith("Z") and len(value) >= 20 and value[10] == "T":
+        return value[:19] + "+0000"
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).strftime("%Y-%m-%dT%H:%M:%S%z")
 
-def copy_images(markdown: str, images_dir: str, post_dir: str) -> (str, bool):
+
+def build_image_index(images_dir: str) -> dict:
+    """Walk the Ghost images directory once; map each filename to its first path."""
+    image_index = {}
+    for root, _, files in os.walk(images_dir):
+        for filename in files:
+            image_index.setdefault(filename, os.path.join(root, filename))
+    return image_index
+
+
+def _image_up_to_date(src: str, dest: str, link_mode: str) -> bool:
+    """Return True if dest already holds src in the requested link mode."""
+    try:
+        if link_mode == "symlink":
+            return os.readlink(dest) == os.path.abspath(src)
+        s, d = os.stat(src), os.lstat(dest)
+    except OSError:
+        return False
+    if stat.S_ISLNK(d.st_mode):
+        return False
+    same_inode = (s.st_dev, s.st_ino) == (d.st_dev, d.st_ino)
+    if link_mode == "hardlink" and s.st_dev == d.st_dev:
+        return same_inode
+    if link_mode == "copy" and same_inode:
+        # A hardlink from an earlier run would let bundle edits reach the backup
+        return False
+    return s.st_size == d.st_size and int(s.st_mtime) == int(d.st_mtime)
+
+
+def copy_image(src: str, dest: str, link_mode: str = "copy") -> None:
+    """Place an image into a bundle by copying, hardlinking or symlinking it.
+
+    Images already up to date (shared by content and feature image, or left
+    from a previous run) are skipped. Hardlinks fall back to a copy when the
+    bundle lives on another filesystem.
+    """
+    if _image_up_to_date(src, dest, link_mode):
+        return
+    # Never write through an old link into the Ghost images tree
+    if os.path.lexists(dest):
+        os.remove(dest)
+    if link_mode == "hardlink":
+        try:
+            os.link(src, dest)
+            return
+        except OSError:
+            pass
+    elif link_mode == "symlink":
+        os.symlink(os.path.abspath(src), dest)
+        return
+    shutil.copy2(src, dest)
+
+
+def copy_images(markdown: str, image_index: dict, post_dir: str, log: list,
+                link_mode: str = "copy") -> (str, bool):
     """Copy referenced images into post directory; return (markdown, has_images)."""
     os.makedirs(post_dir, exist_ok=True)
     replaced = markdown
     found_images = False
-    image_urls = re.findall(r"!\[.*?\]\((.*?)\)", markdown)
+    image_urls = _IMG_MD_RE.findall(markdown)
 
     for url in image_urls:
         parsed = urlparse(url)
         filename = os.path.basename(parsed.path)
-        for root, _, files in os.walk(images_dir):
-            if filename in files:
-                src = os.path.join(root, filename)
-                dest = os.path.join(post_dir, filename)
-                shutil.copy2(src, dest)
-                replaced = replaced.replace(url.strip(), f"./{filename}")
-                found_images = True
-                print(f"   📸 Copied image: {filename}")
-                break
+        src = image_index.get(filename)
+        if src:
+            dest = os.path.join(post_dir, filename)
+            copy_image(src, dest, link_mode)
+            local = f"./{filename}"
+            # Ghost URLs were already localized by localize_images()
+            if url.strip() != local:
+                replaced = replaced.replace(url.strip(), local)
+            found_images = True
+            log.append(f"   📸 Copied image: {filename}")
     return replaced.strip(), found_images
 
 
-def validate_markdown(path: str) -> bool:
-    """Check if a Markdown file contains valid YAML front matter."""
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            content = f.read()
-        if not content.strip().startswith("---"):
-            return False
-        parts = content.split("---")
-        if len(parts) < 3:
-            return False
-        front = yaml.safe_load(parts[1])
-        if not isinstance(front, dict):
-            return False
-        required = ["title", "slug"]
-        if not all(k in front and front[k] for k in required):
-            return False
-        return True
-    except Exception as e:
-        print(f"⚠️  Validation error in {path}: {e}")
-        return False
+def dump_front_matter(front_matter: dict, fmt: str = "yaml") -> str:
+    """Serialize front matter with Hugo's delimiters: YAML (---), TOML (+++) or a JSON object."""
+    if fmt == "json":
+        if orjson is not None:
+            return orjson.dumps(front_matter, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(front_matter, indent=2, ensure_ascii=False)
+    if fmt == "toml":
+        return f"+++\n{tomli_w.dumps(front_matter).strip()}\n+++"
+    body = yaml.dump(front_matter, Dumper=_SafeDumper, sort_keys=False, allow_unicode=True)
+    if "\\U" in body:
+        # libyaml escapes emojis (non-BMP) even with allow_unicode; keep them readable
+        body = yaml.dump(front_matter, Dumper=yaml.SafeDumper, sort_keys=False, allow_unicode=True)
+    return f"---\n{body.strip()}\n---"
+
+
+def validate_front_matter(front_matter: dict) -> bool:
+    """Check that the front matter carries the required title and slug."""
+    return isinstance(front_matter, dict) and all(front_matter.get(k) for k in ("title", "slug"))
+
+
+# === Backup loading ===
+
+def load_backup(path: str) -> (list, dict):
+    """Load a Ghost JSON backup into memory; return (posts, authors by id)."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    del raw
+
+    if "data" in data and "posts" in data["data"]:
+        ghost_data = data["data"]
+    elif "db" in data and isinstance(data["db"], list) and "data" in data["db"][0]:
+        ghost_data = data["db"][0]["data"]
+    else:
+        raise ValueError("❌ Could not detect Ghost data structure")
+
+    posts = ghost_data.get("posts", [])
+    authors = {a["id"]: a for a in ghost_data.get("users", [])}
+    return posts, authors
+
+
+def stream_backup(path: str):
+    """Lazily parse a Ghost JSON backup with ijson; return (post iterator, authors by id).
+
+    Only the users table is held in memory; posts are yielded one by one, so
+    peak memory stays flat regardless of the backup size.
+    """
+    # Same layouts as load_backup(): {"data": {"posts": ...}} or {"db": [{"data": {...}}]}
+    with open(path, "rb") as f:
+        data_prefix = next((prefix[:-len(".posts")] if prefix == "data.posts" else prefix
+                            for prefix, event, _ in ijson.parse(f)
+                            if (prefix, event) in (("data.posts", "start_array"), ("db.item.data", "start_map"))),
+                           None)
+    if data_prefix is None:
+        raise ValueError("❌ Could not detect Ghost data structure")
+    posts_prefix = f"{data_prefix}.posts"
+
+    with open(path, "rb") as f:
+        authors = {a["id"]: a for a in ijson.items(f, f"{data_prefix}.users.item", use_float=True)}
+
+    def posts():
+        with open(path, "rb") as f:
+            yield from ijson.items(f, f"{posts_prefix}.item", use_float=True)
+
+    return posts(), authors
 
 
 # === Core converter ===
 
-def export_post(post, authors, images_dir, out_dir, invalid_dir, site_url, converter,
-                count_valid, count_invalid, default_status=None):
-    """Export a single post or page from Ghost to Hugo format."""
+def make_converter(legacy: bool = False):
+    """Return an HTML → Markdown callable, preferring the Rust-backed html-to-markdown."""
+    if rust_convert is not None and not legacy:
+        options = ConversionOptions(heading_style="atx", strong_em_symbol="*", wrap=False)
+        return lambda html: rust_convert(html, options).content
 
-    title = (post.get("title") or "").strip()
-    slug = safe_slug_from(post)
-    date = post.get("published_at") or post.get("created_at")
-    updated = post.get("updated_at")
-    feature_image = post.get("feature_image")
-    excerpt = (post.get("custom_excerpt") or "").strip()
-    html_content = (post.get("html") or "").strip()
-    tags = post.get("tags", [])
-    author_id = post.get("published_by")
-    author = authors.get(author_id, {})
-    author_name = (author.get("name") or "Unknown").strip()
-    author_bio = (author.get("bio") or "").strip()
+    converter = html2text.HTML2Text()
+    converter.ignore_links = False
+    converter.ignore_images = False
+    converter.body_width = 0
+    return converter.handle
+
+
+def export_post(post, authors, image_index, out_dir, invalid_dir, site_url, converter,
+                default_status=None, link_mode="copy", front_matter_format="yaml", slug=None) -> (bool, list):
+    """Export a single post or page from Ghost to Hugo format.
+
+    Returns (is_valid, log_lines); log lines are collected instead of printed so
+    the caller can emit each post's output in a single write.
+    """
+    log = []
+
+    g = post.get
+    author = authors.get(g("published_by")) or {}
+    # Strip all free-text fields in one pass; missing/None values become ""
+    title, excerpt, html_content, meta_title, meta_description, author_name, author_bio = (
+        v.strip() if isinstance(v, str) else ""
+        for v in (g("title"), g("custom_excerpt"), g("html"), g("meta_title"),
+                  g("meta_description"), author.get("name"), author.get("bio"))
+    )
+    author_name = author_name or "Unknown"
+    slug = slug or safe_slug_from(post)
+    date = g("published_at") or g("created_at")
+    updated = g("updated_at")
+    feature_image = g("feature_image")
+    tags = g("tags", [])
     author_image = author.get("profile_image")
-    reading_time = post.get("reading_time")
-    meta_title = (post.get("meta_title") or "").strip()
-    meta_description = (post.get("meta_description") or "").strip()
-    og_image = post.get("og_image")
-    post_type = post.get("type") or "post"
+    reading_time = g("reading_time")
+    og_image = g("og_image")
+    post_type = g("type") or "post"
 
     html_content = html_content.replace("__GHOST_URL__", site_url)
-    markdown_content = converter.handle(html_content).strip()
+    markdown_content = converter(html_content).strip()
     title_plain = remove_emojis(title).strip()
-    markdown_content = ensure_image_alts(markdown_content, title_plain or "image")
-    markdown_content = rewrite_image_paths(markdown_content)
+    markdown_content = localize_images(markdown_content, title_plain or "image")
 
     if not excerpt:
         first_para = next((p.strip() for p in markdown_content.split("\n\n") if p.strip()), "")
         excerpt = (first_para[:157] + "…") if len(first_para) > 160 else first_para
     if not reading_time:
-        words = len(re.findall(r"\w+", markdown_content))
+        words = len(_WORD_RE.findall(markdown_content))
         reading_time = max(1, round(words / 200))
 
-    date_fmt = datetime.fromisoformat(date.replace("Z", "+00:00")).strftime("%Y-%m-%dT%H:%M:%S%z")
-    lastmod_fmt = datetime.fromisoformat(updated.replace("Z", "+00:00")).strftime("%Y-%m-%dT%H:%M:%S%z") if updated else date_fmt
+    date_fmt = to_hugo_date(date)
+    lastmod_fmt = to_hugo_date(updated) if updated else date_fmt
     is_draft = (default_status == "draft") if default_status else (post["status"] != "published")
 
     # === Front matter ===
@@ -251,34 +445,41 @@ def export_post(post, authors, images_dir, out_dir, invalid_dir, site_url, conve
         feat_name = os.path.basename(feature_image.strip())
         seo_block["image"] = f"./{feat_name}"
     else:
-        match_first_image = re.search(r"!\[.*?\]\(([^)]+)\)", markdown_content)
+        match_first_image = _IMG_MD_RE.search(markdown_content)
         if match_first_image:
             seo_block["image"] = match_first_image.group(1).strip()
     if seo_block:
         front_matter["seo"] = seo_block
 
     # Tags
-    if tags:
-        tag_list = [t["name"].strip() if isinstance(t, dict) else str(t).strip() for t in tags if str(t).strip()]
-        if tag_list:
-            front_matter["tags"] = tag_list
-            front_matter["categories"] = [tag_list[0]]
-
-    yaml_front = yaml.safe_dump(front_matter, sort_keys=False, allow_unicode=True).strip()
+    tag_list = []
+    for t in tags or ():
+        # Ghost tags are plain dicts; a class check is cheaper than isinstance
+        name = ((t.get("name") or "") if t.__class__ is dict else str(t)).strip()
+        if name:
+            tag_list.append(name)
+    if tag_list:
+        front_matter["tags"] = tag_list
+        front_matter["categories"] = tag_list[:1]
+
+    front_block = dump_front_matter(front_matter, front_matter_format)
+
+    # Invalid posts are written straight to the invalid folder
+    is_valid = validate_front_matter(front_matter)
+    if not is_valid:
+        out_dir = invalid_dir
 
     post_dir = os.path.join(out_dir, slug)
-    markdown_replaced, has_images = copy_images(markdown_content, images_dir, post_dir)
-    markdown_replaced = rewrite_image_paths(markdown_replaced)
+    markdown_replaced, has_images = copy_images(markdown_content, image_index, post_dir, log, link_mode)
 
     # Copy feature image to local bundle
     if feature_image:
         feature_filename = os.path.basename(feature_image.strip())
-        for root, _, files in os.walk(images_dir):
-            if feature_filename in files:
-                shutil.copy2(os.path.join(root, feature_filename), os.path.join(post_dir, feature_filename))
-                has_images = True
-                print(f"   🌄 Feature image: {feature_filename}")
-                break
+        feature_src = image_index.get(feature_filename)
+        if feature_src:
+            copy_image(feature_src, os.path.join(post_dir, feature_filename), link_mode)
+            has_images = True
+            log.append(f"   🌄 Feature image: {feature_filename}")
 
     if has_images:
         markdown_path = os.path.join(post_dir, "index.md")
@@ -286,22 +487,93 @@ def export_post(post, authors, images_dir, out_dir, invalid_dir, site_url, conve
         shutil.rmtree(post_dir, ignore_errors=True)
         markdown_path = os.path.join(out_dir, f"{slug}.md")
 
-    full_content = f"---\n{yaml_front}\n---\n\n{markdown_replaced}\n"
-    with open(markdown_path, "w", encoding="utf-8") as f:
-        f.write(full_content.rstrip() + "\n")
+    # markdown_replaced is already stripped; write the pieces without joining copies
+    with open(markdown_path, "w", encoding="utf-8", newline="\n", buffering=1 << 20) as f:
+        f.write(front_block)
+        f.write("\n\n" if markdown_replaced else "\n")
+        if markdown_replaced:
+            f.write(markdown_replaced)
+            f.write("\n")
 
-    if not validate_markdown(markdown_path):
-        count_invalid[0] += 1
-        invalid_target = os.path.join(invalid_dir, slug)
-        if has_images:
-            shutil.move(os.path.dirname(markdown_path), invalid_target)
-        else:
-            shutil.move(markdown_path, invalid_target + ".md")
-        print(f"⚠️  Invalid file moved to: {invalid_target}")
+    if not is_valid:
+        log.append(f"⚠️  Invalid file written to: {markdown_path}")
+        return False, log
+
+    imgs = "bundle" if has_images else "single"
+    log.append(f"✅ [{post_type.upper()}] {slug} → {markdown_path}  ({imgs}, {reading_time} min read)")
+    return True, log
+
+
+# === Worker pool ===
+
+_converter = None
+_shared = None
+
+
+def _init_worker(legacy_converter: bool, shared: dict):
+    """Set up per-process state: one converter plus the read-only export settings.
+
+    Going through the pool initializer pickles the authors and the image index
+    once per worker instead of once per post.
+    """
+    global _converter, _shared
+    _converter = make_converter(legacy_converter)
+    _shared = shared
+
+
+def _export_one(task) -> (bool, list):
+    """Pool entry point: export one (post, slug) pair with the worker's converter and settings."""
+    post, slug = task
+    s = _shared
+    out_dir = s["output_pages"] if post["type"] == "page" else s["output_posts"]
+    is_valid, log = export_post(post, s["authors"], s["image_index"], out_dir, s["invalid_dir"],
+                                s["site_url"], _converter, s["default_status"], s["link_mode"],
+                                s["front_matter_format"], slug)
+    return is_valid, [f"\n➡️  {post['title']} [{post['type']}]"] + log
+
+
+def _export_batch(tasks: list) -> list:
+    """Pool entry point for a batch of posts; amortizes IPC like map(chunksize=...)."""
+    return [_export_one(task) for task in tasks]
+
+
+def _with_unique_slugs(posts):
+    """Yield (post, slug) pairs, suffixing repeated slugs (slug-2, slug-3, ...).
+
+    Resolved in the driver so no two posts ever share an output folder; with
+    parallel workers they would otherwise write and rmtree the same directory.
+    """
+    seen = set()
+    for post in posts:
+        base = slug = safe_slug_from(post)
+        n = 1
+        while slug in seen:
+            n += 1
+            slug = f"{base}-{n}"
+        seen.add(slug)
+        yield post, slug
+
+
+def _run_exports(tasks, workers: int, legacy_converter: bool, shared: dict, chunksize: int = 32):
+    """Yield (is_valid, log_lines) per (post, slug) task in input order, from a process pool or serially.
+
+    Batches are submitted with a bounded look-ahead rather than via
+    Executor.map(), which would drain a streamed task iterator up front.
+    """
+    if workers > 1:
+        tasks = iter(tasks)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(legacy_converter, shared)) as ex:
+            pending = deque()
+            for batch in iter(lambda: list(islice(tasks, chunksize)), []):
+                pending.append(ex.submit(_export_batch, batch))
+                if len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
     else:
-        count_valid[0] += 1
-        imgs = "bundle" if has_images else "single"
-        print(f"✅ [{post_type.upper()}] {slug} → {markdown_path}  ({imgs}, {reading_time} min read)")
+        _init_worker(legacy_converter, shared)
+        yield from map(_export_one, tasks)
 
 
 # === Main CLI ===
@@ -315,45 +587,52 @@ def main():
     parser.add_argument("--output-invalid", default="content/invalid", help="Folder for invalid outputs")
     parser.add_argument("--site-url", default="https://example.com", help="Base URL for image and link rewriting")
     parser.add_argument("--default-status", choices=["published", "draft"], help="Override all post statuses (e.g., import everything as 'draft').")
+    parser.add_argument("--link-mode", choices=["copy", "hardlink", "symlink"], default="hardlink", help="How images are placed into post bundles (hardlink falls back to copy across filesystems)")
+    parser.add_argument("--front-matter", choices=["yaml", "toml", "json"], default="json", help="Front matter format (JSON is by far the fastest to write)")
+    parser.add_argument("--legacy-converter", action="store_true", help="Use the pure-Python html2text converter instead of html-to-markdown")
+    parser.add_argument("--stream", action="store_true", help="Parse the backup lazily with ijson to keep memory flat on very large backups")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of parallel export processes (1 = run serially)")
 
     args = parser.parse_args()
+    if args.front_matter == "toml" and tomli_w is None:
+        parser.error("--front-matter toml requires the 'tomli-w' package")
+    if args.stream and ijson is None:
+        parser.error("--stream requires the 'ijson' package")
 
     os.makedirs(args.output_posts, exist_ok=True)
     os.makedirs(args.output_pages, exist_ok=True)
     os.makedirs(args.output_invalid, exist_ok=True)
 
-    converter = html2text.HTML2Text()
-    converter.ignore_links = False
-    converter.ignore_images = False
-    converter.body_width = 0
-
-    with open(args.input, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    if "data" in data and "posts" in data["data"]:
-        ghost_data = data["data"]
-    elif "db" in data and isinstance(data["db"], list) and "data" in data["db"][0]:
-        ghost_data = data["db"][0]["data"]
-    else:
-        raise ValueError("❌ Could not detect Ghost data structure")
-
-    posts = ghost_data.get("posts", [])
-    authors = {a["id"]: a for a in ghost_data.get("users", [])}
+    image_index = build_image_index(args.images)
 
-    count_valid = [0]
-    count_invalid = [0]
+    posts, authors = stream_backup(args.input) if args.stream else load_backup(args.input)
 
-    for post in posts:
-        if post["status"] not in ["published", "draft"]:
-            continue
-        print(f"\n➡️  {post['title']} [{post['type']}]")
-        target_dir = args.output_pages if post["type"] == "page" else args.output_posts
-        export_post(post, authors, args.images, target_dir, args.output_invalid,
-                    args.site_url, converter, count_valid, count_invalid, args.default_status)
+    shared = {
+        "authors": authors,
+        "image_index": image_index,
+        "output_posts": args.output_posts,
+        "output_pages": args.output_pages,
+        "invalid_dir": args.output_invalid,
+        "site_url": args.site_url,
+        "default_status": args.default_status,
+        "link_mode": args.link_mode,
+        "front_matter_format": args.front_matter,
+    }
+    exportable = (post for post in posts if post["status"] in ["published", "draft"])
+    tasks = _with_unique_slugs(exportable)
+
+    count_valid = 0
+    count_invalid = 0
+    for is_valid, log in _run_exports(tasks, args.workers, args.legacy_converter, shared):
+        sys.stdout.write("\n".join(log) + "\n")
+        if is_valid:
+            count_valid += 1
+        else:
+            count_invalid += 1
 
     print("\n🎉 Conversion finished!")
-    print(f"✅ Valid exports: {count_valid[0]}")
-    print(f"⚠️ Invalid exports moved: {count_invalid[0]}")
+    print(f"✅ Valid exports: {count_valid}")
+    print(f"⚠️ Invalid exports: {count_invalid}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,49 @@
+"""Both HTML → Markdown converters must yield the same bundle for Ghost image cards."""
+
+import importlib.util
+import json
+import os
+
+import pytest
+
+SCRIPT = os.path.join(os.path.dirname(__file__), os.pardir, "ghost-to-hugo.py")
+spec = importlib.util.spec_from_file_location("ghost_to_hugo", SCRIPT)
+g2h = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(g2h)
+
+IMAGE_CARD = (
+    '<figure class="kg-card kg-image-card kg-card-hascaption">'
+    '<img src="__GHOST_URL__/content/images/2020/06/a.jpg" class="kg-image" alt="" '
+    'title="Photo" loading="lazy"><figcaption>Caption</figcaption></figure>'
+)
+
+
+def export_image_card(tmp_path, legacy):
+    images = tmp_path / "images" / "2020" / "06"
+    images.mkdir(parents=True)
+    (images / "a.jpg").write_bytes(b"jpeg")
+    out_dir = tmp_path / "posts"
+    post = {
+        "id": "p1", "title": "Card", "status": "published", "type": "post",
+        "published_at": "2020-06-13T13:52:53.000Z", "html": IMAGE_CARD,
+    }
+    is_valid, _ = g2h.export_post(
+        post, {}, g2h.build_image_index(str(tmp_path / "images")), str(out_dir),
+        str(tmp_path / "invalid"), "https://example.com", g2h.make_converter(legacy),
+        front_matter_format="json",
+    )
+    assert is_valid
+    content = (out_dir / "card" / "index.md").read_text(encoding="utf-8")
+    front, end = json.JSONDecoder().raw_decode(content)
+    return front, content[end:], sorted(os.listdir(out_dir / "card"))
+
+
+@pytest.mark.skipif(g2h.rust_convert is None, reason="html-to-markdown not installed")
+def test_image_card_matches_legacy_converter(tmp_path):
+    rust_front, rust_body, rust_files = export_image_card(tmp_path / "rust", legacy=False)
+    legacy_front, legacy_body, legacy_files = export_image_card(tmp_path / "legacy", legacy=True)
+
+    assert rust_files == legacy_files == ["a.jpg", "index.md"]
+    assert rust_front["seo"]["image"] == legacy_front["seo"]["image"] == "./a.jpg"
+    assert "](./a.jpg" in rust_body
+    assert "](./a.jpg" in legacy_body